@@ -1,18 +1,47 @@
 """Library provider protocols for media libraries."""
 
-from collections.abc import Sequence
-from dataclasses import dataclass
-from datetime import datetime
+import asyncio
+import contextlib
+import hashlib
+import io
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from array import array
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
 from enum import StrEnum
-from typing import ClassVar, Literal, Protocol, Self, TypeVar, runtime_checkable
+from pathlib import Path
+from typing import (
+    Any,
+    ClassVar,
+    Literal,
+    Protocol,
+    Self,
+    TypeVar,
+    overload,
+    runtime_checkable,
+)
 
 from starlette.requests import Request
 
-from anibridge_providers.provider import BaseProvider
+from anibridge_providers.provider import _USE_MSGSPEC, BaseProvider
+
+if _USE_MSGSPEC:
+    import msgspec
 
 __all__ = [
+    "BatchingLibraryProviderMixin",
+    "CachedLibraryProviderMixin",
     "ExternalId",
     "HistoryEntry",
+    "HistoryTable",
     "IdNameSpace",
     "LibraryEntity",
     "LibraryEpisode",
@@ -23,9 +52,13 @@ __all__ = [
     "LibrarySeason",
     "LibrarySection",
     "LibraryShow",
+    "ListItemsRequest",
     "MediaKind",
+    "StreamingLibraryProviderMixin",
+    "normalize_keys",
 ]
 
+_LOG = logging.getLogger(__name__)
 
 LibraryProviderT = TypeVar("LibraryProviderT", bound="LibraryProvider", covariant=True)
 
@@ -39,19 +72,37 @@ class MediaKind(StrEnum):
     EPISODE = "episode"
 
 
+# String hashes are salted per interpreter; cached entity hashes are tagged with the
+# salt so that copies restored in another process (e.g. unpickled) recompute them.
+_HASH_SALT = hash("anibridge")
+
 IdNameSpace = Literal["anidb", "anilist", "imdb", "mal", "plex", "tmdb", "tvdb"]
 
 
-@dataclass(frozen=True, slots=True)
-class ExternalId:
-    """External identifier for a media item."""
+if _USE_MSGSPEC:
 
-    namespace: IdNameSpace
-    value: str
+    class ExternalId(msgspec.Struct, frozen=True, cache_hash=True):
+        """External identifier for a media item."""
 
-    def __repr__(self) -> str:
-        """Return a string representation of the external ID."""
-        return f"{self.namespace}: {self.value}"
+        namespace: IdNameSpace
+        value: str
+
+        def __repr__(self) -> str:
+            """Return a string representation of the external ID."""
+            return f"{self.namespace}: {self.value}"
+
+else:
+
+    @dataclass(frozen=True, slots=True)
+    class ExternalId:
+        """External identifier for a media item."""
+
+        namespace: IdNameSpace
+        value: str
+
+        def __repr__(self) -> str:
+            """Return a string representation of the external ID."""
+            return f"{self.namespace}: {self.value}"
 
 
 @runtime_checkable
@@ -71,8 +122,18 @@ class LibraryEntity(Protocol[LibraryProviderT]):
         ...
 
     def __hash__(self) -> int:
-        """Compute the hash based on the entity's key."""
-        return hash(f"{self.provider().NAMESPACE}:{self.__class__.__name__}:{self.key}")
+        """Compute the hash based on the entity's key.
+
+        The hash is cached on the instance after the first call. Implementations
+        using ``__slots__`` can opt in to caching by declaring a ``_cached_hash`` slot.
+        """
+        cached: tuple[int, int] | None = getattr(self, "_cached_hash", None)
+        if cached is not None and cached[0] == _HASH_SALT:
+            return cached[1]
+        value = hash((self.provider().NAMESPACE, type(self).__name__, self.key))
+        with contextlib.suppress(AttributeError):
+            object.__setattr__(self, "_cached_hash", (_HASH_SALT, value))
+        return value
 
     def __repr__(self) -> str:
         """Return a string representation of the library entity."""
@@ -138,7 +199,8 @@ class LibraryMedia(LibraryEntity[LibraryProviderT], Protocol[LibraryProviderT]):
     async def history(self) -> Sequence[HistoryEntry]:
         """Get the user history entries for the media item.
 
-        This includes view events for child items as well.
+        This includes view events for child items as well. Providers returning large
+        histories may return a `HistoryTable` to avoid allocating an object per entry.
 
         Returns:
             Sequence[HistoryEntry]: User history entries.
@@ -226,6 +288,8 @@ class LibrarySeason(LibraryMedia[LibraryProviderT], Protocol[LibraryProviderT]):
     def show(self) -> LibraryShow[LibraryProviderT]:
         """Get the parent show of the season.
 
+        Called by ``__repr__``; implementations should cache the parent.
+
         Returns:
             LibraryShow: The parent show.
         """
@@ -249,6 +313,8 @@ class LibraryEpisode(LibraryMedia[LibraryProviderT], Protocol[LibraryProviderT])
     def season(self) -> LibrarySeason[LibraryProviderT]:
         """Get the parent season of the episode.
 
+        Implementations should resolve the parent once and cache it.
+
         Returns:
             LibrarySeason: The parent season.
         """
@@ -257,6 +323,8 @@ class LibraryEpisode(LibraryMedia[LibraryProviderT], Protocol[LibraryProviderT])
     def show(self) -> LibraryShow[LibraryProviderT]:
         """Get the parent show of the episode.
 
+        Called by ``__repr__``; implementations should cache the parent.
+
         Returns:
             LibraryShow: The parent show.
         """
@@ -270,12 +338,151 @@ class LibraryEpisode(LibraryMedia[LibraryProviderT], Protocol[LibraryProviderT])
         )
 
 
+if _USE_MSGSPEC:
+
+    class HistoryEntry(msgspec.Struct, frozen=True):
+        """User history event for an item in the library."""
+
+        library_key: str
+        viewed_at: datetime
+
+else:
+
+    @dataclass(frozen=True, slots=True)
+    class HistoryEntry:
+        """User history event for an item in the library."""
+
+        library_key: str
+        viewed_at: datetime
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_us(value: datetime) -> int:
+    """Convert a datetime to epoch microseconds, treating naive values as UTC."""
+    epoch = _NAIVE_EPOCH if value.tzinfo is None else _EPOCH
+    return (value - epoch) // _MICROSECOND
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryTable(Sequence[HistoryEntry]):
+    """Column-oriented sequence of user history events.
+
+    Library keys and view timestamps are stored in parallel columns, with timestamps
+    packed as epoch microseconds in a signed 64-bit ``array``. Compared to a list of
+    `HistoryEntry` objects this avoids two objects per event, and `HistoryEntry`
+    instances are only materialized on access.
+
+    A table holds either naive or aware timestamps, never both. Aware timestamps are
+    read back in UTC, naive timestamps are read back naive.
+    """
+
+    library_keys: tuple[str, ...]
+    viewed_at_us: array[int]
+    naive: bool = False
+
+    # The timestamp column is a mutable array, so tables cannot be hashed
+    __hash__ = None
+
+    def __post_init__(self) -> None:
+        """Validate that both columns have the same length."""
+        if len(self.library_keys) != len(self.viewed_at_us):
+            raise ValueError("library_keys and viewed_at_us must have the same length")
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[HistoryEntry]) -> HistoryTable:
+        """Build a table from history entries.
+
+        Args:
+            entries (Iterable[HistoryEntry]): The history entries to store.
+
+        Returns:
+            HistoryTable: A table holding the given entries.
+
+        Raises:
+            ValueError: If naive and aware timestamps are mixed.
+        """
+        keys: list[str] = []
+        viewed_at_us = array("q")
+        naive: bool | None = None
+        for entry in entries:
+            entry_naive = entry.viewed_at.tzinfo is None
+            if naive is None:
+                naive = entry_naive
+            elif entry_naive != naive:
+                raise ValueError("Cannot mix naive and aware history timestamps")
+            keys.append(entry.library_key)
+            viewed_at_us.append(_to_epoch_us(entry.viewed_at))
+        return cls(
+            library_keys=tuple(keys), viewed_at_us=viewed_at_us, naive=bool(naive)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of history entries."""
+        return len(self.library_keys)
+
+    @overload
+    def __getitem__(self, index: int) -> HistoryEntry: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> HistoryTable: ...
+
+    def __getitem__(self, index: int | slice) -> HistoryEntry | HistoryTable:
+        """Return the entry at an index, or a sub-table for a slice."""
+        if isinstance(index, slice):
+            return HistoryTable(
+                library_keys=self.library_keys[index],
+                viewed_at_us=self.viewed_at_us[index],
+                naive=self.naive,
+            )
+        return HistoryEntry(
+            library_key=self.library_keys[index],
+            viewed_at=self._epoch + self.viewed_at_us[index] * _MICROSECOND,
+        )
+
+    def __iter__(self) -> Iterator[HistoryEntry]:
+        """Iterate over the history entries."""
+        epoch = self._epoch
+        for key, viewed_at_us in zip(self.library_keys, self.viewed_at_us, strict=True):
+            yield HistoryEntry(
+                library_key=key, viewed_at=epoch + viewed_at_us * _MICROSECOND
+            )
+
+    @property
+    def _epoch(self) -> datetime:
+        """The epoch that stored timestamps are relative to."""
+        return _NAIVE_EPOCH if self.naive else _EPOCH
+
+
+def normalize_keys(keys: Iterable[str] | None) -> frozenset[str] | None:
+    """Convert a `list_items` keys filter into a set for constant-time lookups.
+
+    Implementations of `LibraryProvider.list_items` that filter items client-side
+    should call this once on entry instead of testing membership against the
+    original sequence. Keys are interned, as they are typically hashed repeatedly.
+
+    Args:
+        keys (Iterable[str] | None): The keys filter passed to `list_items`.
+
+    Returns:
+        frozenset[str] | None: The keys as a frozen set, or None if not filtering.
+    """
+    if keys is None or isinstance(keys, frozenset):
+        return keys
+    return frozenset(map(sys.intern, keys))
+
+
 @dataclass(frozen=True, slots=True)
-class HistoryEntry:
-    """User history event for an item in the library."""
+class ListItemsRequest:
+    """Arguments of a single `LibraryProvider.list_items` call."""
 
-    library_key: str
-    viewed_at: datetime
+    section: LibrarySection
+    min_last_modified: datetime | None = None
+    require_watched: bool = False
+    keys: Sequence[str] | None = None
 
 
 @runtime_checkable
@@ -303,7 +510,8 @@ class LibraryProvider(BaseProvider, Protocol):
         """List items in a library section.
 
         Each item returned must belong to the specified section and meet the provided
-        filtering criteria.
+        filtering criteria. Implementations filtering by ``keys`` client-side should
+        convert them with `normalize_keys` first.
 
         Args:
             section (LibrarySection): The library section to list items from.
@@ -328,3 +536,526 @@ class LibraryProvider(BaseProvider, Protocol):
                 of library media keys to sync, or None if not applicable.
         """
         ...
+
+
+@dataclass(slots=True)
+class _PendingRequest:
+    """A queued `list_items` call awaiting its batched result."""
+
+    request: ListItemsRequest
+    future: asyncio.Future[Sequence[LibraryMedia]]
+
+    @property
+    def group_key(self) -> tuple[str, bool, datetime | None]:
+        """Key identifying requests that can be served by the same backend query."""
+        return (
+            self.request.section.key,
+            self.request.require_watched,
+            self.request.min_last_modified,
+        )
+
+
+def _merge_requests(requests: Sequence[ListItemsRequest]) -> ListItemsRequest:
+    """Merge requests sharing a section and filters into a single request."""
+    if len(requests) == 1:
+        return requests[0]
+    keys: tuple[str, ...] | None = None
+    if all(request.keys is not None for request in requests):
+        keys = tuple(
+            dict.fromkeys(key for request in requests for key in request.keys or ())
+        )
+    return replace(requests[0], keys=keys)
+
+
+class _Coalescer:
+    """Coalesces concurrent `list_items` calls into `list_items_batched` calls."""
+
+    def __init__(self, provider: BatchingLibraryProviderMixin, max_batch: int) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            provider (BatchingLibraryProviderMixin): The provider to query.
+            max_batch (int): Maximum number of queued calls handled per flush.
+        """
+        self._provider = provider
+        self._max_batch = max_batch
+        self._queue: asyncio.Queue[_PendingRequest] = asyncio.Queue()
+        self._task: asyncio.Task[None] | None = None
+
+    async def submit(self, request: ListItemsRequest) -> Sequence[LibraryMedia]:
+        """Queue a request and wait for its share of the batched result.
+
+        Args:
+            request (ListItemsRequest): The request to queue.
+
+        Returns:
+            Sequence[LibraryMedia]: The items listed for the request.
+        """
+        future: asyncio.Future[Sequence[LibraryMedia]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._queue.put_nowait(_PendingRequest(request=request, future=future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        """Drain the queue, flushing up to `max_batch` calls at a time."""
+        batch: list[_PendingRequest] = []
+        try:
+            while not self._queue.empty():
+                # Yield once so that callers scheduled alongside us can enqueue
+                await asyncio.sleep(0)
+                batch = []
+                while len(batch) < self._max_batch and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                await self._flush(batch)
+        except BaseException as e:
+            # Nothing would restart the worker for calls still queued, so fail them
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            for pending in batch:
+                if pending.future.done():
+                    continue
+                if isinstance(e, asyncio.CancelledError):
+                    pending.future.cancel()
+                else:
+                    pending.future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+
+    async def _flush(self, batch: Sequence[_PendingRequest]) -> None:
+        """Issue one backend query per group of compatible calls in the batch."""
+        groups: dict[tuple[str, bool, datetime | None], list[_PendingRequest]] = {}
+        for pending in batch:
+            groups.setdefault(pending.group_key, []).append(pending)
+
+        merged = [
+            _merge_requests([pending.request for pending in group])
+            for group in groups.values()
+        ]
+        try:
+            results = await self._provider.list_items_batched(merged)
+            if len(results) != len(merged):
+                raise ValueError(
+                    f"list_items_batched returned {len(results)} results for "
+                    f"{len(merged)} requests"
+                )
+            for group, items in zip(groups.values(), results, strict=True):
+                for pending in group:
+                    if pending.future.done():
+                        continue
+                    keys = pending.request.keys
+                    if len(group) == 1 or keys is None:
+                        pending.future.set_result(items)
+                    else:
+                        wanted = normalize_keys(keys)
+                        pending.future.set_result(
+                            [item for item in items if item.key in wanted]
+                        )
+        except Exception as e:
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(e)
+
+
+class StreamingLibraryProviderMixin:
+    """Mixin adding a `stream_items` async iterator over `list_items` results.
+
+    Providers backed by paginated APIs can override `stream_items` to yield items
+    page by page, so that consumers can start processing before the whole section
+    has been fetched.
+
+    Example:
+        @register_library_provider("my_namespace")
+        class MyLibraryProvider(StreamingLibraryProviderMixin, LibraryProvider):
+            async def stream_items(self, section, **filters): ...
+    """
+
+    async def stream_items(
+        self,
+        section: LibrarySection,
+        *,
+        min_last_modified: datetime | None = None,
+        require_watched: bool = False,
+        keys: Sequence[str] | None = None,
+    ) -> AsyncIterator[LibraryMedia]:
+        """Iterate over items in a library section as they become available.
+
+        Accepts the same filters as `list_items`. By default this yields the results
+        of `list_items`; override it to yield items page by page instead.
+
+        Args:
+            section (LibrarySection): The library section to list items from.
+            min_last_modified (datetime | None): If provided, only items modified after
+                this timestamp will be included.
+            require_watched (bool): If True, only include items that have been marked as
+                watched/viewed.
+            keys (Sequence[str] | None): If provided, only include items whose keys are
+                in this sequence.
+
+        Yields:
+            LibraryMedia: Items in the section matching the filters.
+        """
+        items = await self.list_items(
+            section,
+            min_last_modified=min_last_modified,
+            require_watched=require_watched,
+            keys=keys,
+        )
+        for item in items:
+            yield item
+
+
+class BatchingLibraryProviderMixin:
+    """Mixin coalescing concurrent `list_items` calls into batched queries.
+
+    Calls to `list_items` are queued and flushed together on the next iteration of
+    the event loop. Calls targeting the same section with the same filters are merged
+    into a single request, and all merged requests are handed to `list_items_batched`
+    at once, which providers using this mixin must implement.
+
+    Example:
+        @register_library_provider("my_namespace")
+        class MyLibraryProvider(BatchingLibraryProviderMixin, LibraryProvider):
+            async def list_items_batched(self, requests): ...
+
+    Attributes:
+        MAX_BATCH_SIZE (ClassVar[int]): Maximum number of calls handled per flush.
+    """
+
+    MAX_BATCH_SIZE: ClassVar[int] = 64
+
+    async def list_items(
+        self,
+        section: LibrarySection,
+        *,
+        min_last_modified: datetime | None = None,
+        require_watched: bool = False,
+        keys: Sequence[str] | None = None,
+    ) -> Sequence[LibraryMedia]:
+        """List items in a library section, batching concurrent calls.
+
+        Args:
+            section (LibrarySection): The library section to list items from.
+            min_last_modified (datetime | None): If provided, only items modified after
+                this timestamp will be included.
+            require_watched (bool): If True, only include items that have been marked as
+                watched/viewed.
+            keys (Sequence[str] | None): If provided, only include items whose keys are
+                in this sequence.
+
+        Returns:
+            Sequence[LibraryMedia]: The items in the section matching the filters.
+        """
+        coalescer: _Coalescer | None = getattr(self, "_list_items_coalescer", None)
+        if coalescer is None:
+            coalescer = _Coalescer(self, self.MAX_BATCH_SIZE)
+            self._list_items_coalescer = coalescer
+        return await coalescer.submit(
+            ListItemsRequest(
+                section=section,
+                min_last_modified=min_last_modified,
+                require_watched=require_watched,
+                keys=keys,
+            )
+        )
+
+    async def list_items_batched(
+        self, requests: Sequence[ListItemsRequest]
+    ) -> Sequence[Sequence[LibraryMedia]]:
+        """List items for multiple merged `list_items` requests.
+
+        The order of the returned sequence must match the order of the input requests.
+
+        Args:
+            requests (Sequence[ListItemsRequest]): The requests to fulfill.
+
+        Returns:
+            Sequence[Sequence[LibraryMedia]]: The items listed for each request.
+        """
+        raise NotImplementedError("Batched listing not implemented for this provider.")
+
+
+class _ProviderPickler(pickle.Pickler):
+    """Pickler storing references to the owning provider by ID instead of by value."""
+
+    def __init__(self, file: io.BytesIO, provider: object) -> None:
+        """Initialize the pickler.
+
+        Args:
+            file (io.BytesIO): The buffer to write to.
+            provider (object): The provider instance to pickle by reference.
+        """
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self._provider = provider
+
+    def persistent_id(self, obj: Any) -> str | None:
+        """Return a persistent ID for the provider, or None for any other object."""
+        return "provider" if obj is self._provider else None
+
+
+class _ProviderUnpickler(pickle.Unpickler):
+    """Unpickler reattaching provider references to the live provider."""
+
+    def __init__(self, file: io.BytesIO, provider: object) -> None:
+        """Initialize the unpickler.
+
+        Args:
+            file (io.BytesIO): The buffer to read from.
+            provider (object): The provider instance to restore references to.
+        """
+        super().__init__(file)
+        self._provider = provider
+
+    def persistent_load(self, pid: Any) -> object:
+        """Resolve a persistent ID written by `_ProviderPickler`."""
+        if pid != "provider":
+            raise pickle.UnpicklingError(f"Unsupported persistent ID {pid!r}")
+        return self._provider
+
+
+class CachedLibraryProviderMixin:
+    """Mixin persisting `get_sections` and `list_items` results in a SQLite cache.
+
+    The mixin wraps the methods of the class that follows it in the MRO, so it should
+    be listed before a concrete provider class. The cache is stored in
+    ``CACHE_DIR/<NAMESPACE>.db`` and scoped to `cache_scope()` and the provider's
+    user. Results are pickled, with references to the provider itself stored by ID
+    and reattached on load; results that cannot be pickled are not cached. Database
+    and pickling work runs in a worker thread to keep the event loop responsive.
+    Database errors are logged and treated as cache misses, so a corrupt or locked
+    cache never stops the wrapped provider from working.
+
+    Only `list_items` calls bounded by ``min_last_modified`` are cached by default.
+    Full listings and keyed lookups (as issued for webhooks) must reflect the latest
+    state of the library, so they always reach the provider unless
+    ``CACHE_UNBOUNDED_ITEMS`` is enabled.
+
+    Example:
+        class CachedMyLibraryProvider(CachedLibraryProviderMixin, MyLibraryProvider):
+            SECTIONS_CACHE_TTL = 3600
+
+    Attributes:
+        CACHE_DIR (ClassVar[Path | None]): Directory holding the cache databases.
+            Defaults to ``$XDG_CACHE_HOME/anibridge``, or ``~/.cache/anibridge`` if
+            ``XDG_CACHE_HOME`` is not set.
+        SECTIONS_CACHE_TTL (ClassVar[int]): Seconds to cache library sections for.
+        ITEMS_CACHE_TTL (ClassVar[int]): Seconds to cache listed items for.
+        CACHE_UNBOUNDED_ITEMS (ClassVar[bool]): Whether to also cache `list_items`
+            calls without ``min_last_modified``.
+        CACHE_TIMEOUT (ClassVar[float]): Seconds to wait for a locked cache database
+            before skipping the cache.
+    """
+
+    NAMESPACE: ClassVar[str]
+    CACHE_DIR: ClassVar[Path | None] = None
+    SECTIONS_CACHE_TTL: ClassVar[int] = 24 * 60 * 60
+    ITEMS_CACHE_TTL: ClassVar[int] = 60 * 60
+    CACHE_UNBOUNDED_ITEMS: ClassVar[bool] = False
+    CACHE_TIMEOUT: ClassVar[float] = 5.0
+
+    _cache_db: sqlite3.Connection | None = None
+
+    def __init__(self, *, config: dict | None = None) -> None:
+        """Initialize the wrapped provider and remember its configuration.
+
+        Args:
+            config (dict | None): Any configuration options that were detected with the
+                provider's namespace as a prefix.
+        """
+        self._cache_config = config
+        self._cache_lock = threading.Lock()
+        super().__init__(config=config)
+
+    async def initialize(self) -> None:
+        """Open the cache database, then initialize the wrapped provider."""
+        self._cache_db = await asyncio.to_thread(self._cache_open)
+        await super().initialize()
+
+    def cache_scope(self) -> str:
+        """Return a string identifying the backend this provider instance talks to.
+
+        Cache entries are keyed by this scope, so providers sharing a namespace but
+        configured for different servers do not read each other's entries. The default
+        is a digest of the provider configuration; override it to scope by something
+        more specific, such as a server URL or ID.
+
+        Returns:
+            str: The cache scope of this provider instance.
+        """
+        config = json.dumps(self._cache_config, sort_keys=True, default=repr)
+        return hashlib.sha256(config.encode()).hexdigest()
+
+    async def get_sections(self) -> Sequence[LibrarySection]:
+        """Get all available library sections, using the cache when possible.
+
+        Returns:
+            Sequence[LibrarySection]: Available library sections.
+        """
+        cache_key = self._cache_key("sections")
+        sections = await asyncio.to_thread(self._cache_get, cache_key)
+        if sections is None:
+            sections = await super().get_sections()
+            await asyncio.to_thread(
+                self._cache_set, cache_key, sections, self.SECTIONS_CACHE_TTL
+            )
+        return sections
+
+    async def list_items(
+        self,
+        section: LibrarySection,
+        *,
+        min_last_modified: datetime | None = None,
+        require_watched: bool = False,
+        keys: Sequence[str] | None = None,
+    ) -> Sequence[LibraryMedia]:
+        """List items in a library section, using the cache when possible.
+
+        Args:
+            section (LibrarySection): The library section to list items from.
+            min_last_modified (datetime | None): If provided, only items modified after
+                this timestamp will be included.
+            require_watched (bool): If True, only include items that have been marked as
+                watched/viewed.
+            keys (Sequence[str] | None): If provided, only include items whose keys are
+                in this sequence.
+
+        Returns:
+            Sequence[LibraryMedia]: The items in the section matching the filters.
+        """
+        if min_last_modified is None and not self.CACHE_UNBOUNDED_ITEMS:
+            return await super().list_items(
+                section, require_watched=require_watched, keys=keys
+            )
+
+        keys_digest = (
+            "*"
+            if keys is None
+            else hashlib.sha256("\x00".join(keys).encode()).hexdigest()
+        )
+        cache_key = self._cache_key(
+            "items",
+            section.key,
+            str(int(require_watched)),
+            min_last_modified.isoformat() if min_last_modified else "",
+            keys_digest,
+        )
+        items = await asyncio.to_thread(self._cache_get, cache_key)
+        if items is None:
+            items = await super().list_items(
+                section,
+                min_last_modified=min_last_modified,
+                require_watched=require_watched,
+                keys=keys,
+            )
+            await asyncio.to_thread(
+                self._cache_set, cache_key, items, self.ITEMS_CACHE_TTL
+            )
+        return items
+
+    async def clear_cache(self) -> None:
+        """Clear the persistent cache and any provider-local caches."""
+        await asyncio.to_thread(self._cache_clear)
+        await super().clear_cache()
+
+    async def close(self) -> None:
+        """Close the cache database and the wrapped provider."""
+        await asyncio.to_thread(self._cache_close)
+        await super().close()
+
+    def _cache_open(self) -> sqlite3.Connection | None:
+        """Open the cache database and drop expired entries, or None on failure."""
+        cache_dir = self.CACHE_DIR
+        if cache_dir is None:
+            xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+            cache_dir = (
+                Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+            ) / "anibridge"
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = cache_dir / f"{self.NAMESPACE}.db"
+        db: sqlite3.Connection | None = None
+        try:
+            # Connections are used from worker threads, always under `_cache_lock`
+            db = sqlite3.connect(
+                path, timeout=self.CACHE_TIMEOUT, check_same_thread=False
+            )
+            with db:
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, "
+                    "blob BLOB NOT NULL, expires INTEGER NOT NULL)"
+                )
+                db.execute("DELETE FROM kv WHERE expires <= ?", (int(time.time()),))
+        except sqlite3.Error as e:
+            _LOG.warning(f"Disabling cache, could not open {path}: {e}")
+            if db is not None:
+                db.close()
+            return None
+        return db
+
+    def _cache_clear(self) -> None:
+        """Delete all entries from the cache database."""
+        with self._cache_lock:
+            if self._cache_db is None:
+                return
+            try:
+                with self._cache_db:
+                    self._cache_db.execute("DELETE FROM kv")
+            except sqlite3.Error as e:
+                _LOG.warning(f"Could not clear the cache: {e}")
+
+    def _cache_close(self) -> None:
+        """Close the cache database."""
+        with self._cache_lock:
+            if self._cache_db is not None:
+                self._cache_db.close()
+                self._cache_db = None
+
+    def _cache_key(self, *parts: str) -> str:
+        """Build a cache key scoped to the provider instance and its user."""
+        user = self.user()
+        return "\x00".join(
+            (self.cache_scope(), user.key if user is not None else "", *parts)
+        )
+
+    def _cache_get(self, key: str) -> Any | None:
+        """Return the cached value for a key, or None if missing or expired."""
+        with self._cache_lock:
+            if self._cache_db is None:
+                return None
+            try:
+                row = self._cache_db.execute(
+                    "SELECT blob FROM kv WHERE key = ? AND expires > ?",
+                    (key, int(time.time())),
+                ).fetchone()
+            except sqlite3.Error as e:
+                _LOG.warning(f"Could not read cache entry {key!r}: {e}")
+                return None
+        if row is None:
+            return None
+        try:
+            return _ProviderUnpickler(io.BytesIO(row[0]), self).load()
+        except Exception:
+            _LOG.debug(f"Discarding unreadable cache entry {key!r}", exc_info=True)
+            return None
+
+    def _cache_set(self, key: str, value: Any, ttl: int) -> None:
+        """Store a value in the cache for `ttl` seconds, if it can be pickled."""
+        buffer = io.BytesIO()
+        try:
+            _ProviderPickler(buffer, self).dump(value)
+        except Exception:
+            _LOG.debug(f"Not caching unpicklable value for {key!r}", exc_info=True)
+            return
+        with self._cache_lock:
+            if self._cache_db is None:
+                return
+            try:
+                with self._cache_db:
+                    self._cache_db.execute(
+                        "INSERT OR REPLACE INTO kv (key, blob, expires) "
+                        "VALUES (?, ?, ?)",
+                        (key, buffer.getvalue(), int(time.time()) + ttl),
+                    )
+            except sqlite3.Error as e:
+                _LOG.warning(f"Could not write cache entry {key!r}: {e}")
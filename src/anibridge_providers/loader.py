@@ -1,13 +1,18 @@
 """Utilities for dynamically importing provider classes."""
 
+import functools
 import importlib
+import operator
 from types import ModuleType
 from typing import Any
 
 
+@functools.lru_cache(maxsize=256)
 def load_object(import_path: str) -> Any:
     """Load a Python object using ``module:qualname`` syntax.
 
+    Results are cached per import path; use ``load_object.cache_clear()`` to reset.
+
     Args:
         import_path: String path in ``package.module:ClassName`` format. The
             attribute portion may include dotted names for nested objects.
@@ -28,21 +33,22 @@ def load_object(import_path: str) -> Any:
         raise ValueError("Both module and attribute names are required")
 
     module = importlib.import_module(module_path)
-    obj: Any = module
-
-    for attr in qualname.split("."):
-        if not hasattr(obj, attr):
-            raise ValueError(
-                f"Attribute '{attr}' not found while resolving '{import_path}'"
-            )
-        obj = getattr(obj, attr)
 
-    return obj
+    try:
+        return operator.attrgetter(qualname)(module)
+    except AttributeError as e:
+        raise ValueError(
+            f"Attribute '{e.name or qualname}' not found while resolving "
+            f"'{import_path}'"
+        ) from e
 
 
+@functools.lru_cache(maxsize=256)
 def load_module(module_path: str) -> ModuleType:
     """Import and return a module by dotted path.
 
+    Results are cached per module path; use ``load_module.cache_clear()`` to reset.
+
     Args:
         module_path: The dotted path of the module to import.
 
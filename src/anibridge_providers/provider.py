@@ -3,24 +3,50 @@
 This defines the shared surface area between different provider kinds
 (`LibraryProvider`, `ListProvider`, etc.). Individual provider protocols
 extend this protocol for provider-specific operations.
+
+Setting the ``ANIBRIDGE_PROVIDERS_MSGSPEC`` environment variable to ``1`` before
+import defines `User`, `ExternalId` and `HistoryEntry` as frozen ``msgspec.Struct``
+types (install the ``msgspec`` extra), which are cheaper to create and compare.
+Structs are not dataclasses, so ``dataclasses.replace``, ``asdict`` and
+``is_dataclass`` do not work on them; use ``msgspec.structs`` instead.
 """
 
+import os
 from dataclasses import dataclass
 from typing import ClassVar, Protocol, runtime_checkable
 
+_USE_MSGSPEC = os.environ.get("ANIBRIDGE_PROVIDERS_MSGSPEC") == "1"
+
+if _USE_MSGSPEC:
+    import msgspec
+
 __all__ = ["BaseProvider", "User"]
 
 
-@dataclass(frozen=True, slots=True)
-class User:
-    """User information for a media list."""
+if _USE_MSGSPEC:
+
+    class User(msgspec.Struct, frozen=True):
+        """User information for a media list."""
+
+        key: str
+        title: str
+
+        def __hash__(self) -> int:
+            """Compute the hash based on the user's key."""
+            return hash(self.key)
+
+else:
+
+    @dataclass(frozen=True, slots=True)
+    class User:
+        """User information for a media list."""
 
-    key: str
-    title: str
+        key: str
+        title: str
 
-    def __hash__(self) -> int:
-        """Compute the hash based on the user's key."""
-        return hash(self.key)
+        def __hash__(self) -> int:
+            """Compute the hash based on the user's key."""
+            return hash(self.key)
 
 
 @runtime_checkable
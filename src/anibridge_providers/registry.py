@@ -1,9 +1,12 @@
 """Provider registry utilities for AniBridge plugins."""
 
+import functools
+import inspect
 import logging
-from collections.abc import Callable, Iterable
+import sys
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
 from importlib import metadata
 
 from anibridge_providers.library import LibraryProvider, LibraryProviderT
@@ -14,6 +17,7 @@ __all__ = [
     "ProviderDescriptor",
     "ProviderKind",
     "ProviderRegistry",
+    "clear_entry_point_cache",
     "get_global_registry",
     "load_entry_points",
     "register_library_provider",
@@ -23,20 +27,33 @@ __all__ = [
 _LOG = logging.getLogger(__name__)
 
 
-class ProviderKind(str, Enum):
+class ProviderKind(StrEnum):
     """Kinds of providers supported by AniBridge."""
 
     LIBRARY = "library"
     LIST = "list"
 
 
-@dataclass(slots=True)
+def _normalize_namespace(namespace: str) -> str:
+    """Return the interned, lowercased form of a provider namespace."""
+    return sys.intern(namespace.lower())
+
+
+@dataclass(frozen=True, slots=True)
 class ProviderDescriptor:
-    """Metadata describing a provider class registered with the SDK."""
+    """Metadata describing a provider class registered with the SDK.
+
+    Descriptors are hashable and compare equal when they share a kind and namespace,
+    regardless of the provider class.
+    """
 
     namespace: str
     kind: ProviderKind
-    provider_cls: type[BaseProvider]
+    provider_cls: type[BaseProvider] = field(compare=False)
+
+    def __post_init__(self) -> None:
+        """Normalize the namespace to its interned, lowercased form."""
+        object.__setattr__(self, "namespace", _normalize_namespace(self.namespace))
 
 
 @dataclass(slots=True)
@@ -46,6 +63,9 @@ class ProviderRegistry:
     _providers: dict[tuple[ProviderKind, str], ProviderDescriptor] = field(
         default_factory=dict
     )
+    _available: tuple[ProviderDescriptor, ...] | None = field(
+        default=None, init=False, repr=False
+    )
 
     def register(self, descriptor: ProviderDescriptor) -> ProviderDescriptor:
         """Register a provider descriptor, replacing any previous value.
@@ -56,8 +76,8 @@ class ProviderRegistry:
         Returns:
             ProviderDescriptor: The registered provider descriptor.
         """
-        key = (descriptor.kind, descriptor.namespace)
-        self._providers[key] = descriptor
+        self._providers[(descriptor.kind, descriptor.namespace)] = descriptor
+        self._available = None
         return descriptor
 
     def get(self, kind: ProviderKind, namespace: str) -> ProviderDescriptor | None:
@@ -89,16 +109,21 @@ class ProviderRegistry:
             )
         return descriptor
 
-    def available(self) -> list[ProviderDescriptor]:
+    def available(self) -> Sequence[ProviderDescriptor]:
         """Return all registered provider descriptors.
 
+        The returned sequence is an immutable snapshot shared between calls until the
+        next registration.
+
         Returns:
-            list[ProviderDescriptor]: All registered provider descriptors.
+            Sequence[ProviderDescriptor]: All registered provider descriptors.
         """
-        return list(self._providers.values())
+        if self._available is None:
+            self._available = tuple(self._providers.values())
+        return self._available
 
 
-_GLOBAL_REGISTRY: ProviderRegistry | None = None
+_GLOBAL_REGISTRY = ProviderRegistry()
 
 
 def get_global_registry() -> ProviderRegistry:
@@ -107,9 +132,6 @@ def get_global_registry() -> ProviderRegistry:
     Returns:
         ProviderRegistry: The global provider registry.
     """
-    global _GLOBAL_REGISTRY
-    if _GLOBAL_REGISTRY is None:
-        _GLOBAL_REGISTRY = ProviderRegistry()
     return _GLOBAL_REGISTRY
 
 
@@ -119,14 +141,19 @@ def _register_kind(
     provider_cls: type[BaseProvider],
 ) -> type[BaseProvider]:
     """Register a provider class for the given kind and namespace."""
-    namespace = namespace.lower()
+    namespace = _normalize_namespace(namespace)
+    registry = get_global_registry()
+    existing = registry.get(kind, namespace)
+    if existing is not None and existing.provider_cls is provider_cls:
+        return provider_cls
+
     provider_cls.NAMESPACE = namespace
     descriptor = ProviderDescriptor(
         namespace=namespace,
         kind=kind,
         provider_cls=provider_cls,
     )
-    get_global_registry().register(descriptor)
+    registry.register(descriptor)
     return provider_cls
 
 
@@ -180,45 +207,127 @@ def register_list_provider(
 
 ENTRY_POINT_GROUP = "anibridge.providers"
 
+_ENTRY_POINT_CACHE: dict[str, tuple[metadata.EntryPoint, ...]] = {}
+
+
+def _discover_entry_points(group: str) -> tuple[metadata.EntryPoint, ...]:
+    """Collect the entry points of a group from installed distributions.
+
+    Unlike `metadata.entry_points`, distributions whose ``entry_points.txt`` does not
+    declare the group are skipped before their entry points and metadata are parsed.
+    """
+    header = f"[{group}]"
+    seen: set[str] = set()
+    selected: list[metadata.EntryPoint] = []
+    for dist in metadata.distributions():
+        # Only the first distribution of a name on sys.path is active, whether or not
+        # it declares the group. The normalized name is taken from the dist-info
+        # directory name, as `metadata.entry_points` does, without reading METADATA.
+        name = dist._normalized_name
+        if name in seen:
+            continue
+        seen.add(name)
+        text = dist.read_text("entry_points.txt")
+        if not text or header not in text:
+            continue
+        selected.extend(dist.entry_points.select(group=group))
+    return tuple(selected)
+
+
+def _get_entry_points(group: str) -> tuple[metadata.EntryPoint, ...]:
+    """Return the entry points of a group, discovering them only once."""
+    selected = _ENTRY_POINT_CACHE.get(group)
+    if selected is None:
+        selected = _discover_entry_points(group)
+        _ENTRY_POINT_CACHE[group] = selected
+    return selected
+
+
+def clear_entry_point_cache() -> None:
+    """Forget discovered entry points so the next load rescans installed packages."""
+    _ENTRY_POINT_CACHE.clear()
+
+
+def _provider_kind(provider_cls: type) -> ProviderKind | None:
+    """Determine the kind of a provider class, if it is one."""
+    mro = provider_cls.__mro__
+    if ListProvider in mro or isinstance(provider_cls, ListProvider):
+        return ProviderKind.LIST
+    if LibraryProvider in mro or isinstance(provider_cls, LibraryProvider):
+        return ProviderKind.LIBRARY
+    return None
+
+
+_POSITIONAL_PARAMETER_KINDS = frozenset(
+    {
+        inspect.Parameter.POSITIONAL_ONLY,
+        inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        inspect.Parameter.VAR_POSITIONAL,
+    }
+)
+
+
+def _signature_accepts_registry(registrar: Callable[..., object]) -> bool:
+    """Check whether a registrar's signature takes a positional argument."""
+    # Registrars whose signature cannot be inspected are assumed to take the registry
+    try:
+        parameters = inspect.signature(registrar).parameters.values()
+    except ValueError, TypeError:
+        return True
+    return any(
+        parameter.kind in _POSITIONAL_PARAMETER_KINDS for parameter in parameters
+    )
+
+
+_cached_signature_accepts_registry = functools.lru_cache(maxsize=256)(
+    _signature_accepts_registry
+)
+
+
+def _accepts_registry(registrar: Callable[..., object]) -> bool:
+    """Check whether a registrar entry point takes the registry as an argument."""
+    try:
+        return _cached_signature_accepts_registry(registrar)
+    except TypeError:
+        # Unhashable callables cannot be cached
+        return _signature_accepts_registry(registrar)
+
 
 def load_entry_points(group: str = ENTRY_POINT_GROUP) -> None:
     """Load all entry points for provider registration.
 
+    An entry point may reference a provider class, which is registered under its
+    ``NAMESPACE`` (or the entry point name), or a registrar callable, which is called
+    with the global registry if it accepts a positional argument.
+
+    Entry point discovery is cached per group; call `clear_entry_point_cache` after
+    installing or removing provider packages at runtime.
+
     Args:
         group (str): The entry point group to load providers from.
     """
-    selected: Iterable[metadata.EntryPoint] = metadata.entry_points(group=group)
-
-    for entry_point in selected:
+    for entry_point in _get_entry_points(group):
         try:
             obj = entry_point.load()
         except Exception:
             _LOG.exception(f"Failed to load provider entry point '{entry_point}'")
             continue
 
-        if callable(obj):
-            try:
-                obj(get_global_registry())
-            except TypeError:
-                obj()
-        elif isinstance(obj, type):
+        if isinstance(obj, type):
             namespace = getattr(obj, "NAMESPACE", entry_point.name)
-            kind_value = (
-                ProviderKind.LIST
-                if isinstance(obj, ListProvider)
-                else (
-                    ProviderKind.LIBRARY if isinstance(obj, LibraryProvider) else None
-                )
-            )
+            kind_value = _provider_kind(obj)
             if kind_value is None:
                 _LOG.warning(
                     f"Could not determine provider kind for class '{obj}'; skipping"
                 )
                 continue
             _register_kind(kind_value, namespace, obj)
+        elif callable(obj):
+            if _accepts_registry(obj):
+                obj(get_global_registry())
+            else:
+                obj()
         else:
             _LOG.warning(
-                f"Entry point '{entry_point}' returned unsupported object {obj!r}",
-                entry_point,
-                obj,
+                f"Entry point '{entry_point}' returned unsupported object {obj!r}"
             )
@@ -0,0 +1,350 @@
+"""Tests for the library provider helpers."""
+
+import asyncio
+import os
+import sqlite3
+import tempfile
+import unittest
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+from anibridge_providers.library import (
+    BatchingLibraryProviderMixin,
+    CachedLibraryProviderMixin,
+    HistoryEntry,
+    HistoryTable,
+    LibraryProvider,
+    ListItemsRequest,
+    StreamingLibraryProviderMixin,
+)
+
+
+@dataclass
+class _Section:
+    key: str
+
+
+@dataclass
+class _Item:
+    key: str
+
+
+@dataclass
+class _BatchingProvider(BatchingLibraryProviderMixin, LibraryProvider):
+    NAMESPACE = "batching"
+
+    calls: list[Sequence[ListItemsRequest]] = field(default_factory=list)
+    error: Exception | None = None
+    drop_result: bool = False
+    delay: float = 0
+
+    async def list_items_batched(
+        self, requests: Sequence[ListItemsRequest]
+    ) -> Sequence[Sequence[_Item]]:
+        self.calls.append(requests)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        results = [
+            [_Item(key) for key in request.keys or ("a", "b", "c")]
+            for request in requests
+        ]
+        return results[:-1] if self.drop_result else results
+
+
+class _CountingProvider(LibraryProvider):
+    NAMESPACE = "counting"
+
+    def __init__(self, *, config: dict | None = None) -> None:
+        self.calls = 0
+
+    async def get_sections(self) -> Sequence[_Section]:
+        self.calls += 1
+        return [_Section("1")]
+
+    async def list_items(
+        self,
+        section: _Section,
+        *,
+        min_last_modified: datetime | None = None,
+        require_watched: bool = False,
+        keys: Sequence[str] | None = None,
+    ) -> Sequence[_Item]:
+        self.calls += 1
+        return [_Item(key) for key in keys or ("a", "b")]
+
+
+class _CachedProvider(CachedLibraryProviderMixin, _CountingProvider):
+    pass
+
+
+class _StructuralProvider:
+    """Implements the `LibraryProvider` members without subclassing it."""
+
+    NAMESPACE = "structural"
+
+    def __init__(self, *, config: dict | None = None) -> None:
+        pass
+
+    async def initialize(self) -> None:
+        pass
+
+    def user(self) -> None:
+        return None
+
+    async def clear_cache(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+    async def get_sections(self) -> Sequence[_Section]:
+        return []
+
+    async def list_items(self, section: _Section, **filters: object) -> list[_Item]:
+        return []
+
+    async def parse_webhook(self, request: object) -> tuple[bool, Sequence[str]]:
+        return False, ()
+
+
+class LibraryProviderTest(unittest.TestCase):
+    """Tests for the `LibraryProvider` protocol."""
+
+    def test_structural_provider_is_instance(self) -> None:
+        """Classes implementing the protocol members pass `isinstance` checks."""
+        self.assertIsInstance(_StructuralProvider(), LibraryProvider)
+
+
+class BatchingLibraryProviderMixinTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for `BatchingLibraryProviderMixin`."""
+
+    async def test_merges_and_splits_concurrent_calls(self) -> None:
+        """Concurrent calls are merged into one batch and split per caller."""
+        provider = _BatchingProvider()
+        section = _Section("1")
+
+        first, second, everything, watched = await asyncio.gather(
+            provider.list_items(section, keys=["a"]),
+            provider.list_items(section, keys=["b", "a"]),
+            provider.list_items(_Section("2")),
+            provider.list_items(section, require_watched=True, keys=["c"]),
+        )
+
+        self.assertEqual(len(provider.calls), 1)
+        self.assertEqual(
+            [(r.section.key, r.require_watched, r.keys) for r in provider.calls[0]],
+            [("1", False, ("a", "b")), ("2", False, None), ("1", True, ["c"])],
+        )
+        self.assertEqual([item.key for item in first], ["a"])
+        self.assertEqual([item.key for item in second], ["a", "b"])
+        self.assertEqual([item.key for item in everything], ["a", "b", "c"])
+        self.assertEqual([item.key for item in watched], ["c"])
+
+    async def test_backend_error_reaches_every_caller(self) -> None:
+        """A failing batched call fails every coalesced caller."""
+        provider = _BatchingProvider(error=RuntimeError("backend down"))
+
+        results = await asyncio.gather(
+            provider.list_items(_Section("1"), keys=["a"]),
+            provider.list_items(_Section("2")),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            self.assertIsInstance(result, RuntimeError)
+
+    async def test_result_count_mismatch_fails_all_queued_calls(self) -> None:
+        """A wrong result count fails every call, including ones still queued."""
+        provider = _BatchingProvider(drop_result=True)
+        provider.MAX_BATCH_SIZE = 2
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *(provider.list_items(_Section(str(i))) for i in range(5)),
+                return_exceptions=True,
+            ),
+            timeout=1,
+        )
+
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+
+    async def test_cancelled_caller_does_not_affect_others(self) -> None:
+        """Cancelling one caller leaves the rest of its batch intact."""
+        provider = _BatchingProvider(delay=0.01)
+        section = _Section("1")
+
+        cancelled = asyncio.ensure_future(provider.list_items(section, keys=["a"]))
+        other = asyncio.ensure_future(provider.list_items(section, keys=["b"]))
+        await asyncio.sleep(0.001)
+        cancelled.cancel()
+
+        self.assertEqual([item.key for item in await other], ["b"])
+        with self.assertRaises(asyncio.CancelledError):
+            await cancelled
+
+    async def test_missing_batched_implementation_raises(self) -> None:
+        """Providers must implement `list_items_batched` to use the mixin."""
+
+        class Provider(BatchingLibraryProviderMixin, LibraryProvider):
+            NAMESPACE = "unimplemented"
+
+        with self.assertRaises(NotImplementedError):
+            await Provider().list_items(_Section("1"))
+
+
+class StreamingLibraryProviderMixinTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for `StreamingLibraryProviderMixin`."""
+
+    async def test_streams_list_items_results(self) -> None:
+        """The default `stream_items` yields what `list_items` returns."""
+
+        class Provider(StreamingLibraryProviderMixin, _CountingProvider):
+            pass
+
+        provider = Provider()
+
+        items = [item async for item in provider.stream_items(_Section("1"))]
+
+        self.assertEqual(items, [_Item("a"), _Item("b")])
+        self.assertEqual(provider.calls, 1)
+
+
+class HistoryTableTest(unittest.TestCase):
+    """Tests for `HistoryTable`."""
+
+    def test_round_trips_aware_entries(self) -> None:
+        """Aware timestamps read back as equal UTC timestamps."""
+        entries = [
+            HistoryEntry("a", datetime(2024, 1, 1, 12, tzinfo=UTC)),
+            HistoryEntry(
+                "b", datetime(2024, 1, 2, tzinfo=timezone(timedelta(hours=2)))
+            ),
+        ]
+
+        table = HistoryTable.from_entries(entries)
+
+        self.assertEqual(list(table), entries)
+        self.assertEqual(table[1].viewed_at.tzinfo, UTC)
+
+    def test_round_trips_naive_entries(self) -> None:
+        """Naive timestamps read back naive."""
+        entries = [
+            HistoryEntry("a", datetime(2024, 1, 1, 12)),
+            HistoryEntry("b", datetime(2024, 1, 2, 0, 0, 0, 5)),
+        ]
+
+        table = HistoryTable.from_entries(entries)
+
+        self.assertEqual(table[0], entries[0])
+        self.assertEqual(list(table[1:]), entries[1:])
+
+    def test_rejects_mixed_naive_and_aware_entries(self) -> None:
+        """Naive and aware timestamps cannot share a table."""
+        with self.assertRaises(ValueError):
+            HistoryTable.from_entries(
+                [
+                    HistoryEntry("a", datetime(2024, 1, 1)),
+                    HistoryEntry("b", datetime(2024, 1, 1, tzinfo=UTC)),
+                ]
+            )
+
+    def test_is_unhashable(self) -> None:
+        """Tables compare by value but cannot be hashed."""
+        entries = [HistoryEntry("a", datetime(2024, 1, 1, tzinfo=UTC))]
+
+        self.assertEqual(
+            HistoryTable.from_entries(entries), HistoryTable.from_entries(entries)
+        )
+        with self.assertRaises(TypeError):
+            hash(HistoryTable.from_entries(entries))
+
+
+class CachedLibraryProviderMixinTest(unittest.IsolatedAsyncioTestCase):
+    """Tests for `CachedLibraryProviderMixin`."""
+
+    async def asyncSetUp(self) -> None:
+        """Point the default cache directory at a temporary directory."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache_home = Path(tmp.name)
+        patcher = mock.patch.dict(os.environ, {"XDG_CACHE_HOME": tmp.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _provider(self, config: dict | None = None) -> _CachedProvider:
+        provider = _CachedProvider(config=config)
+        await provider.initialize()
+        self.addAsyncCleanup(provider.close)
+        return provider
+
+    async def test_caches_across_instances(self) -> None:
+        """Sections and bounded listings are served from the cache database."""
+        since = datetime(2024, 1, 1, tzinfo=UTC)
+        first = await self._provider()
+        await first.list_items((await first.get_sections())[0], min_last_modified=since)
+        second = await self._provider()
+
+        items = await second.list_items(
+            (await second.get_sections())[0], min_last_modified=since
+        )
+
+        self.assertEqual(items, [_Item("a"), _Item("b")])
+        self.assertEqual(second.calls, 0)
+        self.assertTrue((self.cache_home / "anibridge" / "counting.db").exists())
+
+    async def test_does_not_cache_unbounded_listings(self) -> None:
+        """Full listings and keyed lookups always reach the provider."""
+        provider = await self._provider()
+
+        for _ in range(2):
+            await provider.list_items(_Section("1"))
+            await provider.list_items(_Section("1"), keys=["a"])
+
+        self.assertEqual(provider.calls, 4)
+
+    async def test_scopes_entries_by_config(self) -> None:
+        """Providers configured for different backends do not share entries."""
+        await (await self._provider({"url": "http://a"})).get_sections()
+        other = await self._provider({"url": "http://b"})
+
+        await other.get_sections()
+
+        self.assertEqual(other.calls, 1)
+
+    async def test_falls_back_on_corrupt_database(self) -> None:
+        """A corrupt cache database disables the cache instead of the provider."""
+        db_path = self.cache_home / "anibridge" / "counting.db"
+        db_path.parent.mkdir()
+        db_path.write_bytes(b"not a database" * 512)
+
+        with self.assertLogs("anibridge_providers.library", "WARNING"):
+            provider = await self._provider()
+        for _ in range(2):
+            sections = await provider.get_sections()
+
+        self.assertEqual(sections, [_Section("1")])
+        self.assertEqual(provider.calls, 2)
+
+    async def test_falls_back_on_locked_database(self) -> None:
+        """A locked cache database is skipped instead of failing the call."""
+        with mock.patch.object(_CachedProvider, "CACHE_TIMEOUT", 0):
+            provider = await self._provider()
+        lock = sqlite3.connect(self.cache_home / "anibridge" / "counting.db")
+        self.addCleanup(lock.close)
+        lock.execute("BEGIN EXCLUSIVE")
+
+        with self.assertLogs("anibridge_providers.library", "WARNING"):
+            sections = await provider.get_sections()
+
+        self.assertEqual(sections, [_Section("1")])
+        self.assertEqual(provider.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+"""Tests for the provider registry and entry point loading."""
+
+import sys
+import tempfile
+import unittest
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+from unittest import mock
+
+from anibridge_providers import registry
+from anibridge_providers.library import LibraryProvider
+from anibridge_providers.registry import (
+    ENTRY_POINT_GROUP,
+    ProviderKind,
+    ProviderRegistry,
+    _discover_entry_points,
+    _register_kind,
+    load_entry_points,
+)
+
+
+@dataclass(frozen=True)
+class _EntryPoint:
+    name: str
+    obj: object
+
+    def load(self) -> object:
+        return self.obj
+
+
+class _LibraryProvider(LibraryProvider):
+    NAMESPACE = "MyLibrary"
+
+    def __init__(self, *, config: dict | None = None) -> None:
+        raise AssertionError("Entry point provider classes must not be instantiated")
+
+
+class _UnhashableRegistrar:
+    __hash__ = None
+
+    def __init__(self) -> None:
+        self.calls: list[ProviderRegistry] = []
+
+    def __call__(self, registry: ProviderRegistry) -> None:
+        self.calls.append(registry)
+
+
+def _write_dist(root: Path, name: str, version: str, entry_points: str = "") -> None:
+    dist_info = root / f"{name}-{version}.dist-info"
+    dist_info.mkdir(parents=True)
+    (dist_info / "METADATA").write_text(
+        f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n"
+    )
+    if entry_points:
+        (dist_info / "entry_points.txt").write_text(entry_points)
+
+
+class DiscoverEntryPointsTest(unittest.TestCase):
+    """Tests for `_discover_entry_points`."""
+
+    def setUp(self) -> None:
+        """Create two temporary ``sys.path`` entries."""
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.active = Path(tmp.name) / "active"
+        self.shadowed = Path(tmp.name) / "shadowed"
+        patcher = mock.patch.object(sys, "path", [str(self.active), str(self.shadowed)])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_matches_metadata_entry_points(self) -> None:
+        """Only the first distribution of a name contributes entry points."""
+        _write_dist(
+            self.active,
+            "foo_pkg",
+            "2.0",
+            f"[{ENTRY_POINT_GROUP}]\nnew = foo_pkg:Provider\n",
+        )
+        _write_dist(
+            self.shadowed,
+            "foo_pkg",
+            "1.0",
+            f"[{ENTRY_POINT_GROUP}]\nold = foo_pkg:Provider\n",
+        )
+
+        selected = _discover_entry_points(ENTRY_POINT_GROUP)
+
+        self.assertEqual([ep.name for ep in selected], ["new"])
+        self.assertEqual(
+            selected, tuple(metadata.entry_points(group=ENTRY_POINT_GROUP))
+        )
+
+    def test_ignores_group_of_shadowed_distribution(self) -> None:
+        """A shadowed copy declaring the group is skipped if the active one does not."""
+        _write_dist(self.active, "foo_pkg", "2.0")
+        _write_dist(
+            self.shadowed,
+            "foo_pkg",
+            "1.0",
+            f"[{ENTRY_POINT_GROUP}]\nold = foo_pkg:Provider\n",
+        )
+
+        self.assertEqual(_discover_entry_points(ENTRY_POINT_GROUP), ())
+        self.assertEqual(list(metadata.entry_points(group=ENTRY_POINT_GROUP)), [])
+
+
+class LoadEntryPointsTest(unittest.TestCase):
+    """Tests for `load_entry_points` and `_register_kind`."""
+
+    def setUp(self) -> None:
+        """Swap in an empty global registry."""
+        self.registry = ProviderRegistry()
+        patcher = mock.patch.object(registry, "_GLOBAL_REGISTRY", self.registry)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(setattr, _LibraryProvider, "NAMESPACE", "MyLibrary")
+
+    def _load(self, *objs: object) -> None:
+        entry_points = tuple(_EntryPoint(f"ep{i}", obj) for i, obj in enumerate(objs))
+        with mock.patch.object(
+            registry, "_get_entry_points", return_value=entry_points
+        ):
+            load_entry_points()
+
+    def test_registers_provider_classes(self) -> None:
+        """Provider classes are registered under their normalized namespace."""
+        self._load(_LibraryProvider)
+
+        descriptor = self.registry.require(ProviderKind.LIBRARY, "mylibrary")
+        self.assertIs(descriptor.provider_cls, _LibraryProvider)
+        self.assertEqual(_LibraryProvider.NAMESPACE, "mylibrary")
+
+    def test_calls_registrars(self) -> None:
+        """Registrars get the registry only if they take a positional argument."""
+        calls: list[tuple[object, ...]] = []
+
+        def zero_arg() -> None:
+            calls.append(())
+
+        def one_arg(registry: ProviderRegistry) -> None:
+            calls.append((registry,))
+
+        self._load(zero_arg, one_arg)
+
+        self.assertEqual(calls, [(), (self.registry,)])
+
+    def test_calls_unhashable_registrars(self) -> None:
+        """Unhashable registrars are called without aborting later entry points."""
+        registrar = _UnhashableRegistrar()
+        later_calls: list[tuple[object, ...]] = []
+
+        def later() -> None:
+            later_calls.append(())
+
+        self._load(registrar, later)
+
+        self.assertEqual(registrar.calls, [self.registry])
+        self.assertEqual(later_calls, [()])
+
+    def test_register_kind_is_idempotent(self) -> None:
+        """Registering the same class twice keeps the original descriptor."""
+        _register_kind(ProviderKind.LIBRARY, "MyLibrary", _LibraryProvider)
+        descriptor = self.registry.get(ProviderKind.LIBRARY, "mylibrary")
+        available = self.registry.available()
+
+        _register_kind(ProviderKind.LIBRARY, "mylibrary", _LibraryProvider)
+
+        self.assertIs(self.registry.get(ProviderKind.LIBRARY, "MYLIBRARY"), descriptor)
+        self.assertIs(self.registry.available(), available)
+        self.assertEqual(len(available), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()